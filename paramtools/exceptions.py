@@ -50,6 +50,7 @@ collision_list = [
     "_numpy_type",
     "_parse_errors",
     "_resolve_order",
+    "_override_state",
     "_schema",
     "_set_state",
     "_state",
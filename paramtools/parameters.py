@@ -679,12 +679,7 @@ class Parameters:
           - `ParamToolsError`: Parameter is an array type and has labels.
             This is not supported by ParamTools when using array_first.
         """
-        label_grid = copy.deepcopy(self.label_grid)
-        state = copy.deepcopy(self._state)
-        if labels:
-            parsed_labels = self.parse_labels(**labels)
-            label_grid.update(parsed_labels)
-            state.update(parsed_labels)
+        label_grid, state = self._override_state(**labels)
         if state:
             value_items = list(
                 intersection(
@@ -761,21 +756,24 @@ class Parameters:
                 f"parameter space. {msg}"
             )
 
-        def list_2_tuple(x):
-            return tuple(x) if isinstance(x, list) else x
+        # Position of each label value along its axis, matching
+        # list.index: the first occurrence wins.
+        positions = []
+        for label_name in label_order:
+            label_positions = {}
+            for pos, label_value in enumerate(value_order[label_name]):
+                label_positions.setdefault(label_value, pos)
+            positions.append(label_positions)
 
         arr = np.empty(shape, dtype=self._numpy_type(param))
 
         for vi in value_items:
-            # ix stores the indices of `arr` that need to be filled in.
-            ix = [[] for i in range(len(label_order))]
-            for label_pos, label_name in enumerate(label_order):
-                # assume value_items is dense in the sense that it spans
-                # the label space.
-                ix[label_pos].append(
-                    value_order[label_name].index(vi[label_name])
-                )
-            ix = tuple(map(list_2_tuple, ix))
+            # assume value_items is dense in the sense that it spans
+            # the label space.
+            ix = tuple(
+                label_positions[vi[label_name]]
+                for label_positions, label_name in zip(positions, label_order)
+            )
             arr[ix] = vi["value"]
         return arr
 
@@ -809,12 +807,7 @@ class Parameters:
                     "or the instance attribute should be an array."
                 )
 
-        label_grid = copy.deepcopy(self.label_grid)
-        state = copy.deepcopy(self._state)
-        if labels:
-            parsed_labels = self.parse_labels(**labels)
-            label_grid.update(parsed_labels)
-            state.update(parsed_labels)
+        label_grid, state = self._override_state(**labels)
 
         if state:
             value_items = list(
@@ -885,6 +878,8 @@ class Parameters:
             extend_grid = self._stateless_label_grid[label]
 
         cmp_funcs = self.label_validators[label].cmp_funcs(choices=extend_grid)
+        keyfunc = cmp_funcs["key"]
+        extend_set = set(extend_grid)
 
         adjustment = defaultdict(list)
         for param, data in spec.items():
@@ -892,7 +887,7 @@ class Parameters:
                 continue
             extended_vos = set()
             for vo in sorted(
-                data["value"], key=lambda val: cmp_funcs["key"](val[label])
+                data["value"], key=lambda val: keyfunc(val[label])
             ):
                 hashable_vo = utils.hashable_value_object(vo)
                 if hashable_vo in extended_vos:
@@ -919,9 +914,7 @@ class Parameters:
 
                 defined_vals = {eq_vo[label] for eq_vo in queryset}
 
-                missing_vals = sorted(
-                    set(extend_grid) - defined_vals, key=cmp_funcs["key"]
-                )
+                missing_vals = sorted(extend_set - defined_vals, key=keyfunc)
 
                 if not missing_vals:
                     continue
@@ -930,7 +923,7 @@ class Parameters:
                 for vo in values:
                     extended[vo[label]].append(vo)
 
-                skl = SortedKeyList(extended.keys(), cmp_funcs["key"])
+                skl = SortedKeyList(extended.keys(), keyfunc)
 
                 for val in missing_vals:
                     lte_val = skl.lte(val)
@@ -1115,6 +1108,25 @@ class Parameters:
                 value_order[label_name] = label_values
         return label_order, value_order
 
+    def _override_state(self, **labels):
+        """
+        Copy the label grid and state, overriding them with the parsed
+        `labels`. The copies are shallow since only whole labels are
+        replaced.
+
+        **Returns**
+
+            - `label_grid`: The label grid with `labels` applied.
+            - `state`: The state with `labels` applied.
+        """
+        label_grid = dict(self.label_grid)
+        state = dict(self._state)
+        if labels:
+            parsed_labels = self.parse_labels(**labels)
+            label_grid.update(parsed_labels)
+            state.update(parsed_labels)
+        return label_grid, state
+
     def _numpy_type(self, param):
         """
         Get the numpy type for a given parameter.
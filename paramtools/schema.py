@@ -700,21 +700,27 @@ VALIDATOR_MAP = {
 }
 
 
+# NumPy-backed fields used for parameter values. These take precedence over
+# FIELD_MAP in get_type.
+NUMERIC_FIELD_MAP = {
+    "int": contrib.fields.Int64(
+        allow_none=True, error_messages=INVALID_INTEGER, strict=True
+    ),
+    "bool": contrib.fields.Bool_(
+        allow_none=True, error_messages=INVALID_BOOLEAN
+    ),
+    "float": contrib.fields.Float64(
+        allow_none=True, error_messages=INVALID_NUMBER
+    ),
+}
+
+
 def get_type(data, validators=None):
-    numeric_types = {
-        "int": contrib.fields.Int64(
-            allow_none=True, error_messages=INVALID_INTEGER, strict=True
-        ),
-        "bool": contrib.fields.Bool_(
-            allow_none=True, error_messages=INVALID_BOOLEAN
-        ),
-        "float": contrib.fields.Float64(
-            allow_none=True, error_messages=INVALID_NUMBER
-        ),
-    }
-    types = dict(FIELD_MAP, **numeric_types)
     try:
-        _fieldtype = types[data["type"]]
+        if data["type"] in NUMERIC_FIELD_MAP:
+            _fieldtype = NUMERIC_FIELD_MAP[data["type"]]
+        else:
+            _fieldtype = FIELD_MAP[data["type"]]
         if is_field_class_like(_fieldtype):
             fieldtype = _fieldtype(validate=validators)
         elif is_field_instance_like(_fieldtype):
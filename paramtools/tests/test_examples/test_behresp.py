@@ -7,18 +7,18 @@ from paramtools import Parameters
 CURRENT_PATH = os.path.abspath(os.path.dirname(__file__))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def field_map():
     # nothing here for now
     return {}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def defaults_spec_path():
     return os.path.join(CURRENT_PATH, "../../examples/behresp/defaults.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def BehrespParams(defaults_spec_path):
     class _BehrespParams(Parameters):
         defaults = defaults_spec_path
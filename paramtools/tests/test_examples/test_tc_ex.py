@@ -22,23 +22,24 @@ class CompatibleDataSchema(Schema):
     cps = fields.Boolean()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def register_compatible_data():
+    # Register the field once: each call appends to the global type registry.
     register_custom_type(
         "compatible_data", fields.Nested(CompatibleDataSchema())
     )
 
 
-@pytest.fixture
-def defaults_spec_path():
-    return os.path.join(CURRENT_PATH, "../../examples/taxparams/defaults.json")
-
+class _TaxcalcParams(Parameters):
+    defaults = os.path.join(
+        CURRENT_PATH, "../../examples/taxparams/defaults.json"
+    )
 
-@pytest.fixture
-def TaxcalcParams(defaults_spec_path, register_compatible_data):
-    class _TaxcalcParams(Parameters):
-        defaults = defaults_spec_path
 
+@pytest.fixture(scope="session")
+def TaxcalcParams(register_compatible_data):
+    # The defaults are read on instantiation, after compatible_data is
+    # registered.
     return _TaxcalcParams
 
 
@@ -47,18 +48,14 @@ def test_load_schema(TaxcalcParams):
     assert params
 
 
-@pytest.fixture
-def demo_defaults_spec_path():
-    return os.path.join(
+class _TaxDemoParams(Parameters):
+    defaults = os.path.join(
         CURRENT_PATH, "../../examples/taxparams-demo/defaults.json"
     )
 
 
-@pytest.fixture
-def TaxDemoParams(demo_defaults_spec_path):
-    class _TaxDemoParams(Parameters):
-        defaults = demo_defaults_spec_path
-
+@pytest.fixture(scope="session")
+def TaxDemoParams():
     return _TaxDemoParams
 
 
@@ -2,6 +2,10 @@ import copy
 import os
 import json
 import datetime
+import functools
+import itertools
+import pickle
+from operator import itemgetter
 from collections import OrderedDict
 from random import shuffle
 
@@ -24,30 +28,61 @@ from paramtools import (
 from paramtools.contrib import Bool_
 
 CURRENT_PATH = os.path.abspath(os.path.dirname(__file__))
+DEFAULTS_SPEC_PATH = os.path.join(CURRENT_PATH, "defaults.json")
+EXTEND_EX_PATH = os.path.join(CURRENT_PATH, "extend_ex.json")
 
+DATE_2018_01_15 = datetime.date(2018, 1, 15)
+DATE_2018_01_17 = datetime.date(2018, 1, 17)
 
-@pytest.fixture
+
+@functools.lru_cache(maxsize=None)
+def load_defaults(path):
+    """
+    Parse a JSON defaults file once per path. Callers that modify the
+    result must copy it first.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
 def defaults_spec_path():
-    return os.path.join(CURRENT_PATH, "defaults.json")
+    return DEFAULTS_SPEC_PATH
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def extend_ex_path():
-    return os.path.join(CURRENT_PATH, "extend_ex.json")
+    return EXTEND_EX_PATH
 
 
-@pytest.fixture
-def array_first_defaults(defaults_spec_path):
-    with open(defaults_spec_path) as f:
-        r = json.loads(f.read())
-    r.pop("float_list_param")
-    r.pop("simple_int_list_param")
-    r.pop("float_list_when_param")
-    r.pop("when_array_param")
-    return r
+@pytest.fixture(scope="session")
+def _array_first_defaults(defaults_spec_path):
+    drop = (
+        "float_list_param",
+        "simple_int_list_param",
+        "float_list_when_param",
+        "when_array_param",
+    )
+    return {
+        k: v
+        for k, v in load_defaults(defaults_spec_path).items()
+        if k not in drop
+    }
+
+
+@pytest.fixture(scope="session")
+def _array_first_defaults_pickle(_array_first_defaults):
+    return pickle.dumps(_array_first_defaults, protocol=5)
 
 
 @pytest.fixture
+def array_first_defaults(_array_first_defaults_pickle):
+    # Tests modify the value objects in place. The data is plain JSON, so
+    # unpickling is a cheaper deep copy than copy.deepcopy.
+    return pickle.loads(_array_first_defaults_pickle)
+
+
+@pytest.fixture(scope="session")
 def TestParams(defaults_spec_path):
     class _TestParams(Parameters):
         defaults = defaults_spec_path
@@ -55,10 +90,39 @@ def TestParams(defaults_spec_path):
     return _TestParams
 
 
-@pytest.fixture(scope="function")
-def af_params(array_first_defaults):
+@pytest.fixture(scope="session")
+def _params(TestParams):
+    return TestParams()
+
+
+@pytest.fixture
+def params(_params):
+    return copy.deepcopy(_params)
+
+
+@pytest.fixture(scope="session")
+def baseline_spec(_params):
+    # The default specification of an unmodified TestParams. It is built
+    # from a copy so that its value objects are not shared with _params.
+    return copy.deepcopy(_params).specification()
+
+
+@pytest.fixture
+def fresh_params(_params):
+    # For tests that need more than one independent instance.
+    return lambda: copy.deepcopy(_params)
+
+
+@pytest.fixture
+def params_zero_one(params):
+    params.set_state(label0="zero", label1=1)
+    return params
+
+
+@pytest.fixture(scope="module")
+def af_params(_array_first_defaults):
     class AFParams(Parameters):
-        defaults = array_first_defaults
+        defaults = _array_first_defaults
 
     _af_params = AFParams(
         initial_state={"label0": "zero", "label1": 1}, array_first=True
@@ -70,8 +134,7 @@ def test_init(TestParams):
     params = TestParams()
     assert params
     assert params._data
-    for param in params._data:
-        assert getattr(params, param)
+    assert all(getattr(params, param) for param in params._data)
     assert params.label_grid
     assert params.label_grid == params._stateless_label_grid
 
@@ -168,8 +231,7 @@ class TestSchema:
 
 
     def test_schema_not_dropped(self, defaults_spec_path):
-        with open(defaults_spec_path, "r") as f:
-            defaults_ = json.loads(f.read())
+        defaults_ = copy.deepcopy(load_defaults(defaults_spec_path))
 
         class TestParams(Parameters):
             defaults = defaults_
@@ -357,8 +419,7 @@ class TestSchema:
 
 
 class TestValues:
-    def test(self, TestParams, defaults_spec_path):
-        params = TestParams()
+    def test(self, params):
         assert isinstance(params.sel["min_int_param"], Values)
         assert isinstance(params.sel["min_int_param"]["label0"], Slice)
 
@@ -367,80 +428,74 @@ class TestValues:
 
 
 class TestAccess:
-    def test_specification(self, TestParams, defaults_spec_path):
-        params = TestParams()
-        spec1 = params.specification()
+    def test_specification(self, baseline_spec, defaults_spec_path):
+        spec1 = baseline_spec
 
-        with open(defaults_spec_path) as f:
-            exp = json.loads(f.read())
-        exp.pop("schema")
+        exp = load_defaults(defaults_spec_path)
 
-        assert set(spec1.keys()) == set(exp.keys())
+        assert set(spec1.keys()) == set(exp.keys()) - {"schema"}
 
         assert spec1["min_int_param"] == exp["min_int_param"]["value"]
 
-    def test_is_ordered(self, TestParams):
-        params = TestParams()
+    def test_is_ordered(self, params):
         spec1 = params.specification()
         assert isinstance(spec1, OrderedDict)
 
         spec2 = params.specification(meta_data=True, serializable=True)
         assert isinstance(spec2, OrderedDict)
 
-    def test_specification_query(self, TestParams):
-        params = TestParams()
-        spec1 = params.specification()
+    def test_specification_query(self, params, baseline_spec):
+        spec1 = baseline_spec
         exp = {
             "min_int_param": [{"label0": "one", "label1": 2, "value": 2}],
             "max_int_param": [{"label0": "one", "label1": 2, "value": 4}],
         }
+        min_max = itemgetter("min_int_param", "max_int_param")
         spec2 = params.specification(label0="one")
         # check that specification method got only the value item with label0="one"
-        assert spec2["min_int_param"] == exp["min_int_param"]
-        assert spec2["max_int_param"] == exp["max_int_param"]
+        assert min_max(spec2) == min_max(exp)
 
         # check that get method got only value item with label0="one"
         params.set_state(label0="one")
-        assert params.min_int_param == exp["min_int_param"]
-        assert params.max_int_param == exp["max_int_param"]
+        assert (params.min_int_param, params.max_int_param) == min_max(exp)
 
         # check that specification method gets other data, not containing a label0
         # label.
-        for param, data in spec1.items():
-            if all("label0" not in val_item for val_item in data):
-                assert spec2[param] == data
+        no_label0 = {
+            param: data
+            for param, data in spec1.items()
+            if not any("label0" in val_item for val_item in data)
+        }
+        assert {param: spec2[param] for param in no_label0} == no_label0
 
         params.delete({"str_choice_param": None})
         assert "str_choice_param" not in params.specification()
         assert "str_choice_param" in params.specification(include_empty=True)
 
-    def test_serializable(self, TestParams, defaults_spec_path):
-        params = TestParams()
-
-        assert json.dumps(params.specification(serializable=True))
-        assert json.dumps(
-            params.specification(serializable=True, meta_data=True)
-        )
-
+    def test_serializable(self, params, defaults_spec_path):
         spec = params.specification(serializable=True)
+        meta_spec = params.specification(serializable=True, meta_data=True)
+        assert json.dumps(spec)
+        assert json.dumps(meta_spec)
+
         # Make sure "value" is removed when meta_data is False
         for value in spec.values():
             assert "value" not in value
 
-        with open(defaults_spec_path) as f:
-            exp = json.loads(f.read())
-        exp.pop("schema")
+        exp = {
+            k: v
+            for k, v in load_defaults(defaults_spec_path).items()
+            if k != "schema"
+        }
 
-        spec = params.specification(serializable=True, meta_data=True)
-        assert spec == params._defaults_schema.dump(
+        assert meta_spec == params._defaults_schema.dump(
             params._defaults_schema.load(exp)
         )
 
-    def test_dump(self, TestParams, defaults_spec_path):
-        params1 = TestParams()
-        spec = params1.specification(serializable=True, meta_data=True)
-        schema = params1._schema
-        dumped = params1.dump()
+    def test_dump(self, params):
+        spec = params.specification(serializable=True, meta_data=True)
+        schema = params._schema
+        dumped = params.dump()
         assert dumped == {**spec, **{"schema": schema}}
 
         class TestParams2(Parameters):
@@ -449,18 +504,17 @@ class TestAccess:
         params2 = TestParams2()
         assert params2.dump() == dumped
 
-    def test_dump_with_labels(self, TestParams, defaults_spec_path):
-        params1 = TestParams()
-        spec = params1.specification(
+    def test_dump_with_labels(self, params):
+        spec = params.specification(
             serializable=True,
             include_empty=True,
             meta_data=True,
             label0="one",
             sort_values=True,
         )
-        schema = params1._schema
-        params1.set_state(label0="one")
-        dumped = params1.dump(sort_values=True)
+        schema = params._schema
+        params.set_state(label0="one")
+        dumped = params.dump(sort_values=True)
         assert dumped == {**spec, **{"schema": schema}}
 
         class TestParams2(Parameters):
@@ -470,9 +524,7 @@ class TestAccess:
         params2.set_state(label0="one")
         assert params2.dump() == dumped
 
-    def test_iterable(self, TestParams):
-        params = TestParams()
-
+    def test_iterable(self, params):
         act = set([])
         for param in params:
             act.add(param)
@@ -658,41 +710,75 @@ class TestAccess:
         ]
 
 
-class TestAdjust:
-    def test_adjust_int_param(self, TestParams):
-        params = TestParams()
-        params.set_state(label0="one", label1=2)
-
-        adjustment = {
-            "min_int_param": [{"label0": "one", "label1": 2, "value": 3}]
-        }
-        params.adjust(adjustment)
-        assert params.min_int_param == adjustment["min_int_param"]
-
-    def test_simultaneous_adjust(self, TestParams):
-        """
-        Adjust min_int_param above original max_int_param value at same time as
-        max_int_param value is adjusted up. This tests that the new param is
-        compared against the adjusted reference param if the reference param is
-        specified.
-        """
-        params = TestParams()
-        params.set_state(label0="zero", label1=1)
-        adjustment = {
+# Label state, adjustment, and the parameter values expected afterwards.
+ADJUST_CASES = [
+    pytest.param(
+        {"label0": "one", "label1": 2},
+        {"min_int_param": [{"label0": "one", "label1": 2, "value": 3}]},
+        {"min_int_param": [{"label0": "one", "label1": 2, "value": 3}]},
+        id="adjust_int_param",
+    ),
+    # Adjust min_int_param above original max_int_param value at same time
+    # as max_int_param value is adjusted up. This tests that the new param
+    # is compared against the adjusted reference param if the reference
+    # param is specified.
+    pytest.param(
+        {"label0": "zero", "label1": 1},
+        {
             "min_int_param": [{"label0": "zero", "label1": 1, "value": 4}],
             "max_int_param": [{"label0": "zero", "label1": 1, "value": 5}],
-        }
+        },
+        {
+            "min_int_param": [{"label0": "zero", "label1": 1, "value": 4}],
+            "max_int_param": [{"label0": "zero", "label1": 1, "value": 5}],
+        },
+        id="simultaneous_adjust",
+    ),
+    pytest.param(
+        {},
+        {"when_param": 2, "str_choice_param": "value1"},
+        {"when_param": [{"value": 2}]},
+        id="adjust_when_param_2",
+    ),
+    pytest.param(
+        {},
+        {"when_param": 0},
+        {"when_param": [{"value": 0}]},
+        id="adjust_when_param_0",
+    ),
+    pytest.param(
+        {},
+        {"when_array_param": [0, 1, 0, 0]},
+        {"when_array_param": [{"value": [0, 1, 0, 0]}]},
+        id="adjust_when_array_param",
+    ),
+    pytest.param(
+        {},
+        {"float_list_when_param": [0, 2.0, 2.0, 2.0]},
+        {
+            "float_list_when_param": [
+                {"label0": "zero", "value": [0, 2.0, 2.0, 2.0]}
+            ]
+        },
+        id="adjust_float_list_when_param",
+    ),
+]
+
+
+class TestAdjust:
+    @pytest.mark.parametrize("state,adjustment,exp", ADJUST_CASES)
+    def test_adjust(self, params, state, adjustment, exp):
+        params.set_state(**state)
         params.adjust(adjustment)
-        assert params.min_int_param == adjustment["min_int_param"]
-        assert params.max_int_param == adjustment["max_int_param"]
+        for param, value in exp.items():
+            assert getattr(params, param) == value
 
-    def test_transaction(self, TestParams):
+    def test_transaction(self, params_zero_one):
         """
         Use transaction manager to defer schema level validation until all adjustments
         are complete.
         """
-        params = TestParams()
-        params.set_state(label0="zero", label1=1)
+        params = params_zero_one
         adjustment = {
             "min_int_param": [{"label0": "zero", "label1": 1, "value": 4}],
             "max_int_param": [{"label0": "zero", "label1": 1, "value": 5}],
@@ -703,26 +789,24 @@ class TestAdjust:
         assert params.min_int_param == adjustment["min_int_param"]
         assert params.max_int_param == adjustment["max_int_param"]
 
-    def test_transaction_with_when_parameter(self, TestParams):
+    def test_transaction_with_when_parameter(self, params):
         """
         When validator returns None when validate_schema is False for performance
         reasons.
         """
-        params = TestParams()
         with params.transaction(defer_validation=True):
             params.adjust({"when_param": 2, "str_choice_param": "value1"})
 
         assert params.when_param == [{"value": 2}]
 
-    def test_adjust_many_labels(self, TestParams):
+    def test_adjust_many_labels(self, params_zero_one):
         """
         Adjust min_int_param above original max_int_param value at same time as
         max_int_param value is adjusted up. This tests that the new param is
         compared against the adjusted reference param if the reference param is
         specified.
         """
-        params = TestParams()
-        params.set_state(label0="zero", label1=1)
+        params = params_zero_one
         adjustment = {
             "min_int_param": [{"label0": "one", "label1": 2, "value": 2}],
             "int_default_param": 5,
@@ -744,14 +828,13 @@ class TestAdjust:
         ]
         assert params.date_param == [
             {
-                "value": datetime.date(2018, 1, 17),
+                "value": DATE_2018_01_17,
                 "label1": 1,
                 "label0": "zero",
             }
         ]
 
-    def test_adjust_none_basic(self, TestParams):
-        params = TestParams()
+    def test_adjust_none_basic(self, params):
         adj = {
             "min_int_param": [{"label0": "one", "label1": 2, "value": None}],
             "str_choice_param": [{"value": None}],
@@ -761,14 +844,13 @@ class TestAdjust:
         assert len(params.min_int_param) == 1
         assert len(params.str_choice_param) == 0
 
-    def test_adjust_none_many_values(self, TestParams):
-        params = TestParams()
+    def test_adjust_none_many_values(self, params, fresh_params):
         adj = {"int_dense_array_param": [{"value": None}]}
         params.adjust(adj)
         assert len(params._data["int_dense_array_param"]["value"]) == 0
         assert len(params.int_dense_array_param) == 0
 
-        params = TestParams()
+        params = fresh_params()
         adj = {"int_dense_array_param": [{"label0": "zero", "value": None}]}
         params.adjust(adj)
         assert len(params._data["int_dense_array_param"]["value"]) == 18
@@ -790,8 +872,7 @@ class TestAdjust:
             == 18
         )
 
-    def test_delete(self, TestParams):
-        params = TestParams()
+    def test_delete(self, params, fresh_params):
         adj = {
             "min_int_param": [{"label0": "one", "label1": 2, "value": 2}],
             "str_choice_param": None,
@@ -801,13 +882,13 @@ class TestAdjust:
         assert len(params.min_int_param) == 1
         assert len(params.str_choice_param) == 0
 
-        params = TestParams()
+        params = fresh_params()
         adj = {"int_dense_array_param": None}
         params.delete(adj)
         assert len(params._data["int_dense_array_param"]["value"]) == 0
         assert len(params.int_dense_array_param) == 0
 
-        params = TestParams()
+        params = fresh_params()
         adj = {"int_dense_array_param": [{"label0": "zero", "value": 2}]}
         params.delete(adj)
         assert len(params._data["int_dense_array_param"]["value"]) == 18
@@ -829,145 +910,41 @@ class TestAdjust:
             == 18
         )
 
-    def test_adjust_when_param(self, TestParams):
-        params = TestParams()
-        params.adjust({"when_param": 2, "str_choice_param": "value1"})
-        assert params.when_param == [{"value": 2}]
-
-        params = TestParams()
-        params.adjust({"when_param": 0})
-        assert params.when_param == [{"value": 0}]
-
-    def test_adjust_when_array_param(self, TestParams):
-        params = TestParams()
-        params.adjust({"when_array_param": [0, 1, 0, 0]})
-        assert params.when_array_param == [{"value": [0, 1, 0, 0]}]
-
-    def test_adjust_float_list_when_param(self, TestParams):
-        params = TestParams()
-        params.adjust({"float_list_when_param": [0, 2.0, 2.0, 2.0]})
-        assert params.float_list_when_param == [
-            {"label0": "zero", "value": [0, 2.0, 2.0, 2.0]}
-        ]
-
-
-class TestValidationMessages:
-    def test_attributes(self, TestParams):
-        params = TestParams()
-        assert params.errors == {}
-        assert params.warnings == {}
-
-    def test_errors(self, TestParams):
-        params = TestParams()
-        adj = {"min_int_param": [{"value": "abc"}]}
-        with pytest.raises(ValidationError) as excinfo:
-            params.adjust(adj)
-
-        exp_user_message = {"min_int_param": ["Not a valid integer: abc."]}
-        assert json.loads(excinfo.value.args[0]) == {
-            "errors": exp_user_message
-        }
-
-        exp_internal_message = {
-            "min_int_param": [["Not a valid integer: abc."]]
-        }
-        assert excinfo.value.messages["errors"] == exp_internal_message
-
-        exp_labels = {"min_int_param": [{}]}
-        assert excinfo.value.labels["errors"] == exp_labels
-
-        params = TestParams()
-        adj = {"min_int_param": "abc"}
-        with pytest.raises(ValidationError) as excinfo:
-            params.adjust(adj)
-
-    def test_label_errors(self, TestParams):
-        params = TestParams()
-
-        params.adjust(
-            {"min_int_param": [{"value": 2, "label1": 6}]}, raise_errors=False
-        )
-
-        assert params.errors["min_int_param"] == [
-            "Input 6 must be less than 5."
-        ]
-
-        params = TestParams()
-
-        params.adjust(
-            {"min_int_param": [{"value": 2, "label1": -1}]}, raise_errors=False
-        )
-
-        assert params.errors["min_int_param"] == [
-            "Input -1 must be greater than 0."
-        ]
 
-    def test_errors_choice_param(self, TestParams):
-        params = TestParams()
-        adjustment = {"str_choice_param": [{"value": "not a valid choice"}]}
-        with pytest.raises(ValidationError) as excinfo:
-            params.adjust(adjustment)
-        msg = [
-            'str_choice_param "not a valid choice" must be in list of choices value0, '
-            "value1."
-        ]
-        assert (
-            json.loads(excinfo.value.args[0])["errors"]["str_choice_param"]
-            == msg
-        )
-
-        params = TestParams()
-        adjustment = {"str_choice_param": [{"value": 4}]}
-        params = TestParams()
-        with pytest.raises(ValidationError) as excinfo:
-            params.adjust(adjustment)
-        msg = ["Not a valid string."]
-        assert (
-            json.loads(excinfo.value.args[0])["errors"]["str_choice_param"]
-            == msg
-        )
-
-        params = TestParams()
-        params.adjust(adjustment, raise_errors=False)
-        msg = ["Not a valid string."]
-        assert params.errors["str_choice_param"] == msg
-
-        params = TestParams()
-        with pytest.raises(ValidationError) as excinfo:
-            params.adjust(adjustment)
-        msg = ["Not a valid string."]
-        assert (
-            json.loads(excinfo.value.args[0])["errors"]["str_choice_param"]
-            == msg
-        )
-
-        params = TestParams()
-        params.adjust(adjustment, raise_errors=False)
-        params.errors["str_choice_param"] == ["Not a valid string."]
-
-    def test_errors_default_reference_param(self, TestParams):
-        params = TestParams()
-        params.set_state(label0="zero", label1=1)
-        # value under the default.
-        curr = params.int_default_param[0]["value"]
-        adjustment = {"int_default_param": [{"value": curr - 1}]}
-        params.adjust(adjustment, raise_errors=False)
-        exp = [f"int_default_param {curr-1} < min 2 default"]
-        assert params.errors["int_default_param"] == exp
-
-    def test_errors_int_param(self, TestParams):
-        params = TestParams()
-        adjustment = {
-            "min_int_param": [{"label0": "zero", "label1": 1, "value": 2.5}]
-        }
-
-        params.adjust(adjustment, raise_errors=False)
-        exp = {"min_int_param": ["Not a valid integer: 2.5."]}
-        assert params.errors == exp
-
-    def test_errors_multiple_params(self, TestParams):
-        params = TestParams()
-        adjustment = {
+# Adjustments that fail validation and the error messages they produce.
+ERROR_CASES = [
+    pytest.param(
+        {"min_int_param": [{"value": 2, "label1": 6}]},
+        {"min_int_param": ["Input 6 must be less than 5."]},
+        id="label_too_high",
+    ),
+    pytest.param(
+        {"min_int_param": [{"value": 2, "label1": -1}]},
+        {"min_int_param": ["Input -1 must be greater than 0."]},
+        id="label_too_low",
+    ),
+    pytest.param(
+        {"str_choice_param": [{"value": "not a valid choice"}]},
+        {
+            "str_choice_param": [
+                'str_choice_param "not a valid choice" must be in list of '
+                "choices value0, value1."
+            ]
+        },
+        id="choice_invalid",
+    ),
+    pytest.param(
+        {"str_choice_param": [{"value": 4}]},
+        {"str_choice_param": ["Not a valid string."]},
+        id="choice_not_string",
+    ),
+    pytest.param(
+        {"min_int_param": [{"label0": "zero", "label1": 1, "value": 2.5}]},
+        {"min_int_param": ["Not a valid integer: 2.5."]},
+        id="int_float",
+    ),
+    pytest.param(
+        {
             "min_int_param": [
                 {"label0": "zero", "label1": 1, "value": "not a number"},
                 {"label0": "one", "label1": 2, "value": "still not a number"},
@@ -975,116 +952,171 @@ class TestValidationMessages:
             "date_param": [
                 {"label0": "zero", "label1": 1, "value": "not a date"}
             ],
-        }
-
-        params.adjust(adjustment, raise_errors=False)
-        exp = {
+        },
+        {
             "min_int_param": [
                 "Not a valid integer: not a number.",
                 "Not a valid integer: still not a number.",
             ],
             "date_param": ["Not a valid date: not a date."],
-        }
-        assert params.errors == exp
-
-    def test_list_type_errors(self, TestParams):
-        params = TestParams()
-
-        adj = {
+        },
+        id="multiple_params",
+    ),
+    pytest.param(
+        {"float_param": [2.5]},
+        {"float_param": ["Not a valid number: [2.5]."]},
+        id="float_not_scalar",
+    ),
+    pytest.param(
+        {"bool_param": [False]},
+        {"bool_param": ["Not a valid boolean: [False]."]},
+        id="bool_not_scalar",
+    ),
+    pytest.param(
+        {
             "float_list_param": [
-                {"value": ["abc", 0, "def", 1], "label0": "zero", "label1": 1},
-                {"value": [-1, "ijk"], "label0": "one", "label1": 2},
+                {"value": [-1, 1], "label0": "zero", "label1": 1}
             ]
-        }
-        with pytest.raises(ValidationError) as excinfo:
-            params.adjust(adj)
-        exp_user_message = {
+        },
+        {
             "float_list_param": [
-                "Not a valid number: abc.",
-                "Not a valid number: def.",
-                "Not a valid number: ijk.",
+                "float_list_param[label0=zero, label1=1] "
+                "[np.float64(-1.0), np.float64(1.0)] < min 0 "
             ]
-        }
-        assert json.loads(excinfo.value.args[0]) == {
-            "errors": exp_user_message
-        }
-
-        exp_internal_message = {
+        },
+        id="list_range",
+    ),
+]
+
+
+# Messages and labels for an invalid min_int_param adjustment.
+INT_EXP_USER_MESSAGE = {"min_int_param": ["Not a valid integer: abc."]}
+INT_EXP_INTERNAL_MESSAGE = {"min_int_param": [["Not a valid integer: abc."]]}
+INT_EXP_LABELS = {"min_int_param": [{}]}
+
+# Messages and labels for an invalid float_list_param adjustment.
+LIST_TYPE_EXP_USER_MESSAGE = {
+    "float_list_param": [
+        "Not a valid number: abc.",
+        "Not a valid number: def.",
+        "Not a valid number: ijk.",
+    ]
+}
+LIST_TYPE_EXP_INTERNAL_MESSAGE = {
+    "float_list_param": [
+        ["Not a valid number: abc.", "Not a valid number: def."],
+        ["Not a valid number: ijk."],
+    ]
+}
+LIST_TYPE_EXP_LABELS = {
+    "float_list_param": [
+        {"label0": "zero", "label1": 1},
+        {"label0": "one", "label1": 2},
+    ]
+}
+
+# Adjustments with the user message, internal messages, and labels carried
+# by the ValidationError they raise.
+ERROR_DETAIL_CASES = [
+    pytest.param(
+        {"min_int_param": [{"value": "abc"}]},
+        INT_EXP_USER_MESSAGE,
+        INT_EXP_INTERNAL_MESSAGE,
+        INT_EXP_LABELS,
+        id="int_type",
+    ),
+    pytest.param(
+        {
             "float_list_param": [
-                ["Not a valid number: abc.", "Not a valid number: def."],
-                ["Not a valid number: ijk."],
+                {"value": ["abc", 0, "def", 1], "label0": "zero", "label1": 1},
+                {"value": [-1, "ijk"], "label0": "one", "label1": 2},
             ]
-        }
-        assert excinfo.value.messages["errors"] == exp_internal_message
+        },
+        LIST_TYPE_EXP_USER_MESSAGE,
+        LIST_TYPE_EXP_INTERNAL_MESSAGE,
+        LIST_TYPE_EXP_LABELS,
+        id="list_type",
+    ),
+]
 
-        exp_labels = {
-            "float_list_param": [
-                {"label0": "zero", "label1": 1},
-                {"label0": "one", "label1": 2},
-            ]
-        }
-        assert excinfo.value.labels["errors"] == exp_labels
 
-        params = TestParams()
-        adjustment = {"float_param": [2.5]}
+STR_CHOICE_WARN_EXP_MSG = [
+    'str_choice_warn_param "not a valid choice" must be in list of choices '
+    "value0, value1."
+]
+INT_WARN_EXP_MSG = ["int_warn_param -1 < min 0 "]
 
-        params.adjust(adjustment, raise_errors=False)
-        exp = {"float_param": ["Not a valid number: [2.5]."]}
-        assert params.errors == exp
 
-        params = TestParams()
-        adjustment = {"bool_param": [False]}
+class TestValidationMessages:
+    def test_attributes(self, params):
+        assert params.errors == {}
+        assert params.warnings == {}
 
-        params.adjust(adjustment, raise_errors=False)
-        exp = {"bool_param": ["Not a valid boolean: [False]."]}
-        assert params.errors == exp
+    @pytest.mark.parametrize(
+        "adjustment,exp_user,exp_internal,exp_labels", ERROR_DETAIL_CASES
+    )
+    def test_error_details(
+        self, params, adjustment, exp_user, exp_internal, exp_labels
+    ):
+        with pytest.raises(ValidationError) as excinfo:
+            params.adjust(adjustment)
 
-    def test_range_validation_on_list_param(self, TestParams):
-        params = TestParams()
-        adj = {
-            "float_list_param": [
-                {"value": [-1, 1], "label0": "zero", "label1": 1}
-            ]
-        }
-        params.adjust(adj, raise_errors=False)
-        exp = ["float_list_param[label0=zero, label1=1] [np.float64(-1.0), np.float64(1.0)] < min 0 "]
+        assert json.loads(excinfo.value.args[0]) == {"errors": exp_user}
+        assert excinfo.value.messages["errors"] == exp_internal
+        assert excinfo.value.labels["errors"] == exp_labels
 
-        assert params.errors["float_list_param"] == exp
+    def test_errors(self, params):
+        with pytest.raises(ValidationError, match="Not a valid integer: abc."):
+            params.adjust({"min_int_param": "abc"})
+
+    def test_errors_default_reference_param(self, params_zero_one):
+        params = params_zero_one
+        # value under the default.
+        curr = params.int_default_param[0]["value"]
+        adjustment = {"int_default_param": [{"value": curr - 1}]}
+        params.adjust(adjustment, raise_errors=False)
+        exp = [f"int_default_param {curr-1} < min 2 default"]
+        assert params.errors["int_default_param"] == exp
 
-    def test_warnings(self, TestParams):
-        params = TestParams()
+    @pytest.mark.parametrize("raise_errors", [True, False])
+    @pytest.mark.parametrize("adjustment,exp", ERROR_CASES)
+    def test_adjust_errors(self, params, adjustment, exp, raise_errors):
+        if raise_errors:
+            with pytest.raises(ValidationError) as excinfo:
+                params.adjust(adjustment)
+            assert json.loads(excinfo.value.args[0])["errors"] == exp
+        else:
+            params.adjust(adjustment, raise_errors=False)
+        assert params.errors == exp
+
+    def test_warnings(self, fresh_params):
+        params = fresh_params()
         with pytest.raises(ValidationError) as excinfo:
             params.adjust({"str_choice_warn_param": "not a valid choice"})
 
         assert params.warnings
         assert not params.errors
 
-        msg = [
-            'str_choice_warn_param "not a valid choice" must be in list of choices value0, '
-            "value1."
-        ]
         assert (
             json.loads(excinfo.value.args[0])["warnings"][
                 "str_choice_warn_param"
             ]
-            == msg
+            == STR_CHOICE_WARN_EXP_MSG
         )
 
-        params = TestParams()
+        params = fresh_params()
         with pytest.raises(ValidationError) as excinfo:
             params.adjust({"int_warn_param": -1})
 
         assert params.warnings
         assert not params.errors
 
-        msg = ["int_warn_param -1 < min 0 "]
         assert (
             json.loads(excinfo.value.args[0])["warnings"]["int_warn_param"]
-            == msg
+            == INT_WARN_EXP_MSG
         )
 
-    def test_ignore_warnings(self, TestParams):
-        params = TestParams()
+    def test_ignore_warnings(self, params):
         params.adjust({"int_warn_param": -2}, ignore_warnings=True)
         assert params.int_warn_param == [{"value": -2}]
         assert not params.errors
@@ -1211,20 +1243,20 @@ class TestValidationMessages:
             msg == "param is validated against default in an invalid context."
         )
 
-    def test_when_validation_examples(self, TestParams):
-        params = TestParams()
-        with pytest.raises(ValidationError) as excinfo:
+    def test_when_validation_examples(self, fresh_params):
+        params = fresh_params()
+        with pytest.raises(ValidationError, match="when_param 2 > max 0"):
             params.adjust({"when_param": 2})
 
-        params = TestParams()
+        params = fresh_params()
         with pytest.raises(ValidationError):
             params.adjust({"when_array_param": [0, 2, 0, 0]})
 
-        params = TestParams()
+        params = fresh_params()
         with pytest.raises(ValidationError):
             params.adjust({"when_array_param": [0, 1, 0]})
 
-        params = TestParams()
+        params = fresh_params()
         with pytest.raises(ValidationError) as excinfo:
             params.adjust({"float_list_when_param": [-1, 0, 0, 0]})
 
@@ -1278,8 +1310,7 @@ class TestValidationMessages:
         with pytest.raises(ValidationError):
             params.adjust({"param": params.when_param - 1})
 
-    def test_deserialized(self, TestParams):
-        params = TestParams()
+    def test_deserialized(self, params):
         params._adjust({"min_int_param": [{"value": 1}]}, deserialized=True)
         assert params.min_int_param == [
             {"label0": "zero", "label1": 1, "value": 1},
@@ -1295,31 +1326,16 @@ class TestValidationMessages:
         assert params.errors["min_int_param"] == ["min_int_param -1 < min 0 "]
 
 
+# int_dense_array_param from defaults.json as a label0 x label1 x label2
+# array.
+INT_DENSE_ARRAY_EXP = np.arange(1, 37).reshape(2, 6, 3)
+
+
 class TestArray:
-    def test_to_array(self, TestParams):
-        params = TestParams()
+    def test_to_array(self, params):
         res = params.to_array("int_dense_array_param")
 
-        exp = [
-            [
-                [1, 2, 3],
-                [4, 5, 6],
-                [7, 8, 9],
-                [10, 11, 12],
-                [13, 14, 15],
-                [16, 17, 18],
-            ],
-            [
-                [19, 20, 21],
-                [22, 23, 24],
-                [25, 26, 27],
-                [28, 29, 30],
-                [31, 32, 33],
-                [34, 35, 36],
-            ],
-        ]
-
-        assert res.tolist() == exp
+        np.testing.assert_array_equal(res, INT_DENSE_ARRAY_EXP)
 
         exp = params.int_dense_array_param
         assert params.from_array("int_dense_array_param", res) == exp
@@ -1331,12 +1347,11 @@ class TestArray:
         with pytest.raises(SparseValueObjectsException):
             params.to_array("int_dense_array_param")
 
-    def test_from_array(self, TestParams):
-        params = TestParams()
+    def test_from_array(self, params):
         with pytest.raises(TypeError):
             params.from_array("min_int_param")
 
-    def test_resolve_order(self, TestParams):
+    def test_resolve_order(self, params):
         exp_label_order = ["label0", "label2"]
         exp_value_order = {"label0": ["zero", "one"], "label2": [0, 1, 2]}
         vi = [
@@ -1348,7 +1363,6 @@ class TestArray:
             {"label0": "one", "label2": 2, "value": 1},
         ]
 
-        params = TestParams()
         params.madeup = vi
         params._data["madeup"] = {"value": vi, "type": "int"}
         value_items = params.select_eq("madeup", False, **params._state)
@@ -1369,33 +1383,23 @@ class TestArray:
         with pytest.raises(InconsistentLabelsException):
             params._resolve_order("madeup", value_items, params.label_grid)
 
-    def test_to_array_with_state1(self, TestParams):
-        params = TestParams()
+    def test_to_array_with_state1(self, params, fresh_params):
         params.set_state(label0="zero")
         res = params.to_array("int_dense_array_param")
 
-        exp = [
-            [
-                [1, 2, 3],
-                [4, 5, 6],
-                [7, 8, 9],
-                [10, 11, 12],
-                [13, 14, 15],
-                [16, 17, 18],
-            ]
-        ]
+        exp = INT_DENSE_ARRAY_EXP[:1]
 
-        assert res.tolist() == exp
+        np.testing.assert_array_equal(res, exp)
 
         assert (
             params.from_array("int_dense_array_param", res)
             == params.int_dense_array_param
         )
 
-        params = TestParams()
+        params = fresh_params()
         res = params.to_array("int_dense_array_param", label0="zero")
 
-        assert res.tolist() == exp
+        np.testing.assert_array_equal(res, exp)
 
         act = copy.deepcopy(
             params.from_array("int_dense_array_param", res, label0="zero")
@@ -1403,43 +1407,25 @@ class TestArray:
         params.set_state(label0="zero")
         assert act == params.int_dense_array_param
 
-    def test_to_array_with_state2(self, TestParams):
-        params = TestParams()
+    def test_to_array_with_state2(self, params, fresh_params):
         # Drop values 3 and 4 from label1
         params.set_state(label1=[0, 1, 2, 5])
         res = params.to_array("int_dense_array_param")
 
         # Values 3 and 4 were removed from label1.
-        exp = [
-            [
-                [1, 2, 3],
-                [4, 5, 6],
-                [7, 8, 9],
-                # [10, 11, 12],
-                # [13, 14, 15],
-                [16, 17, 18],
-            ],
-            [
-                [19, 20, 21],
-                [22, 23, 24],
-                [25, 26, 27],
-                # [28, 29, 30],
-                # [31, 32, 33],
-                [34, 35, 36],
-            ],
-        ]
+        exp = INT_DENSE_ARRAY_EXP[:, [0, 1, 2, 5], :]
 
-        assert res.tolist() == exp
+        np.testing.assert_array_equal(res, exp)
 
         assert (
             params.from_array("int_dense_array_param", res)
             == params.int_dense_array_param
         )
 
-        params = TestParams()
+        params = fresh_params()
         res = params.to_array("int_dense_array_param", label1=[0, 1, 2, 5])
 
-        assert res.tolist() == exp
+        np.testing.assert_array_equal(res, exp)
 
         act = copy.deepcopy(
             params.from_array(
@@ -1450,41 +1436,41 @@ class TestArray:
         assert act == params.int_dense_array_param
 
 
+# Successive set_state calls and the state they leave behind.
+SET_STATE_CASES = [
+    pytest.param([], {}, id="no_state"),
+    pytest.param([{"label0": "zero"}], {"label0": ["zero"]}, id="one_label"),
+    pytest.param(
+        [{"label0": "zero"}, {"label1": 0}],
+        {"label0": ["zero"], "label1": [0]},
+        id="two_calls",
+    ),
+    pytest.param(
+        [{"label0": "zero"}, {"label1": 0}, {"label0": "one", "label2": 1}],
+        {"label0": ["one"], "label1": [0], "label2": [1]},
+        id="overwrite_label",
+    ),
+    pytest.param(
+        [{"label1": 0}, {"label0": "one", "label2": 1}, {}],
+        {"label0": ["one"], "label1": [0], "label2": [1]},
+        id="empty_call_keeps_state",
+    ),
+    pytest.param(
+        [{"label1": 0}, {"label0": "one", "label2": 1}, {"label1": [1, 2, 3]}],
+        {"label0": ["one"], "label1": [1, 2, 3], "label2": [1]},
+        id="overwrite_with_list",
+    ),
+]
+
+
 class TestState:
-    def test_basic_set_state(self, TestParams):
-        params = TestParams()
-        assert params.view_state() == {}
-        params.set_state(label0="zero")
-        assert params.view_state() == {"label0": ["zero"]}
-        params.set_state(label1=0)
-        assert params.view_state() == {"label0": ["zero"], "label1": [0]}
-        params.set_state(label0="one", label2=1)
-        assert params.view_state() == {
-            "label0": ["one"],
-            "label1": [0],
-            "label2": [1],
-        }
-        params.set_state(**{})
-        assert params.view_state() == {
-            "label0": ["one"],
-            "label1": [0],
-            "label2": [1],
-        }
-        params.set_state()
-        assert params.view_state() == {
-            "label0": ["one"],
-            "label1": [0],
-            "label2": [1],
-        }
-        params.set_state(label1=[1, 2, 3])
-        assert params.view_state() == {
-            "label0": ["one"],
-            "label1": [1, 2, 3],
-            "label2": [1],
-        }
+    @pytest.mark.parametrize("states,exp", SET_STATE_CASES)
+    def test_basic_set_state(self, params, states, exp):
+        for state in states:
+            params.set_state(**state)
+        assert params.view_state() == exp
 
-    def test_label_grid(self, TestParams):
-        params = TestParams()
+    def test_label_grid(self, params):
         exp = {
             "label0": ["zero", "one"],
             "label1": [0, 1, 2, 3, 4, 5],
@@ -1512,8 +1498,7 @@ class TestState:
             "label2": [1],
         }
 
-    def test_set_state_updates_values(self, TestParams):
-        params = TestParams()
+    def test_set_state_updates_values(self, params):
         defaultexp = [
             {"label0": "zero", "label1": 1, "value": 1},
             {"label0": "one", "label1": 2, "value": 2},
@@ -1533,17 +1518,15 @@ class TestState:
         assert params.min_int_param == defaultexp
         assert params.label_grid == params._stateless_label_grid
 
-    def test_set_state_errors(self, TestParams):
-        params = TestParams()
+    def test_set_state_errors(self, params, fresh_params):
         with pytest.raises(ValidationError):
             params.set_state(label0="notalabel")
 
-        params = TestParams()
+        params = fresh_params()
         with pytest.raises(ValidationError):
             params.set_state(notalabel="notalabel")
 
-    def test_state_with_list(self, TestParams):
-        params = TestParams()
+    def test_state_with_list(self, params):
         params.set_state(label0="zero", label1=[0, 1])
         exp = [
             {"label0": "zero", "label1": 0, "label2": 0, "value": 1},
@@ -1559,11 +1542,13 @@ class TestState:
 class TestArrayFirst:
     def test_basic(self, af_params):
         assert af_params
-        assert af_params.min_int_param.tolist() == [[1]]
-        assert af_params.date_max_param.tolist() == [
-            [datetime.date(2018, 1, 15)]
-        ]
-        assert af_params.int_dense_array_param.tolist() == [[[4, 5, 6]]]
+        np.testing.assert_array_equal(af_params.min_int_param, [[1]])
+        np.testing.assert_array_equal(
+            af_params.date_max_param, [[DATE_2018_01_15]]
+        )
+        np.testing.assert_array_equal(
+            af_params.int_dense_array_param, [[[4, 5, 6]]]
+        )
         assert af_params.str_choice_param == "value0"
 
     def test_from_array(self, af_params):
@@ -1651,37 +1636,39 @@ class TestArrayFirst:
         assert isinstance(params.mystring, str)
 
 
-class TestCollisions:
-    def test_collision_list(self):
-        class CollisionParams(Parameters):
-            defaults = {"schema": {"labels": {}, "additional_members": {}}}
+class CollisionParams(Parameters):
+    defaults = {"schema": {"labels": {}, "additional_members": {}}}
 
-        params = CollisionParams()
 
-        # check to make sure that the collisionlist does not need to be updated.
-        # Note: dir(obj) lists out all class or instance attributes and methods.
-        assert set(collision_list) == {
-            name for name in dir(params) if not name.startswith("__")
-        }
+class ErrorsCollisionParams(Parameters):
+    defaults = {
+        "schema": {"labels": {}, "additional_members": {}},
+        "errors": {
+            "title": "Collides with 'errors'",
+            "description": "",
+            "notes": "",
+            "type": "int",
+            "value": [{"value": 0}],
+            "validators": {"range": {"min": 0, "max": 10}},
+        },
+    }
 
-    def test_collision(self):
-        defaults_dict = {
-            "schema": {"labels": {}, "additional_members": {}},
-            "errors": {
-                "title": "Collides with 'errors'",
-                "description": "",
-                "notes": "",
-                "type": "int",
-                "value": [{"value": 0}],
-                "validators": {"range": {"min": 0, "max": 10}},
-            },
-        }
 
-        class CollisionParams(Parameters):
-            defaults = defaults_dict
+@pytest.fixture(scope="session")
+def collision_attrs():
+    params = CollisionParams()
+    # Note: dir(obj) lists out all class or instance attributes and methods.
+    return {name for name in dir(params) if not name.startswith("__")}
 
+
+class TestCollisions:
+    def test_collision_list(self, collision_attrs):
+        # check to make sure that the collisionlist does not need to be updated.
+        assert set(collision_list) == collision_attrs
+
+    def test_collision(self):
         with pytest.raises(ParameterNameCollisionException) as excinfo:
-            CollisionParams()
+            ErrorsCollisionParams()
 
         exp_msg = (
             "The paramter name, 'errors', is already used by the "
@@ -1708,43 +1695,13 @@ class TestExtend:
 
         # Where label 1 is 2, 4, and 5, the value is set to the last
         # known value, given the value object's label values.
+        exp_arr = INT_DENSE_ARRAY_EXP[:, [0, 1, 1, 3, 3, 3], :]
         exp = [
-            {"label0": "zero", "label1": 0, "label2": 0, "value": 1},
-            {"label0": "zero", "label1": 0, "label2": 1, "value": 2},
-            {"label0": "zero", "label1": 0, "label2": 2, "value": 3},
-            {"label0": "zero", "label1": 1, "label2": 0, "value": 4},
-            {"label0": "zero", "label1": 1, "label2": 1, "value": 5},
-            {"label0": "zero", "label1": 1, "label2": 2, "value": 6},
-            {"label0": "zero", "label1": 2, "label2": 0, "value": 4},
-            {"label0": "zero", "label1": 2, "label2": 1, "value": 5},
-            {"label0": "zero", "label1": 2, "label2": 2, "value": 6},
-            {"label0": "zero", "label1": 3, "label2": 0, "value": 10},
-            {"label0": "zero", "label1": 3, "label2": 1, "value": 11},
-            {"label0": "zero", "label1": 3, "label2": 2, "value": 12},
-            {"label0": "zero", "label1": 4, "label2": 0, "value": 10},
-            {"label0": "zero", "label1": 4, "label2": 1, "value": 11},
-            {"label0": "zero", "label1": 4, "label2": 2, "value": 12},
-            {"label0": "zero", "label1": 5, "label2": 0, "value": 10},
-            {"label0": "zero", "label1": 5, "label2": 1, "value": 11},
-            {"label0": "zero", "label1": 5, "label2": 2, "value": 12},
-            {"label0": "one", "label1": 0, "label2": 0, "value": 19},
-            {"label0": "one", "label1": 0, "label2": 1, "value": 20},
-            {"label0": "one", "label1": 0, "label2": 2, "value": 21},
-            {"label0": "one", "label1": 1, "label2": 0, "value": 22},
-            {"label0": "one", "label1": 1, "label2": 1, "value": 23},
-            {"label0": "one", "label1": 1, "label2": 2, "value": 24},
-            {"label0": "one", "label1": 2, "label2": 0, "value": 22},
-            {"label0": "one", "label1": 2, "label2": 1, "value": 23},
-            {"label0": "one", "label1": 2, "label2": 2, "value": 24},
-            {"label0": "one", "label1": 3, "label2": 0, "value": 28},
-            {"label0": "one", "label1": 3, "label2": 1, "value": 29},
-            {"label0": "one", "label1": 3, "label2": 2, "value": 30},
-            {"label0": "one", "label1": 4, "label2": 0, "value": 28},
-            {"label0": "one", "label1": 4, "label2": 1, "value": 29},
-            {"label0": "one", "label1": 4, "label2": 2, "value": 30},
-            {"label0": "one", "label1": 5, "label2": 0, "value": 28},
-            {"label0": "one", "label1": 5, "label2": 1, "value": 29},
-            {"label0": "one", "label1": 5, "label2": 2, "value": 30},
+            {"label0": label0, "label1": label1, "label2": label2, "value": v}
+            for (label0, label1, label2), v in zip(
+                itertools.product(["zero", "one"], range(6), range(3)),
+                exp_arr.ravel().tolist(),
+            )
         ]
 
         class AFParams(Parameters):
@@ -1754,6 +1711,7 @@ class TestExtend:
 
         params = AFParams()
         assert isinstance(params.int_dense_array_param, np.ndarray)
+        np.testing.assert_array_equal(params.int_dense_array_param, exp_arr)
         assert params.from_array("int_dense_array_param") == exp
         for val in params._data["int_dense_array_param"]["value"]:
             if val["label1"] in (2, 4, 5):
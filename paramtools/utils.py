@@ -63,6 +63,13 @@ def _read(
         )
 
 
+# first group captures quoted strings (double or single)
+# second group captures comments (//single-line or /* multi-line */)
+_COMMENTS_REGEX = re.compile(
+    r"(\".*?\"|\'.*?\')|(/\*.*?\*/|//[^\r\n]*$)", re.MULTILINE | re.DOTALL
+)
+
+
 def remove_comments(string):
     """
     Remove single and multiline comments from JSON.
@@ -70,10 +77,6 @@ def remove_comments(string):
     StackOverflow magic:
     https://stackoverflow.com/a/18381470/9100772
     """
-    pattern = r"(\".*?\"|\'.*?\')|(/\*.*?\*/|//[^\r\n]*$)"
-    # first group captures quoted strings (double or single)
-    # second group captures comments (//single-line or /* multi-line */)
-    regex = re.compile(pattern, re.MULTILINE | re.DOTALL)
 
     def _replacer(match):
         # if the 2nd group (capturing comments) is not None,
@@ -83,7 +86,7 @@ def remove_comments(string):
         else:  # otherwise, we will return the 1st group
             return match.group(1)  # captured quoted-string
 
-    return regex.sub(_replacer, string)
+    return _COMMENTS_REGEX.sub(_replacer, string)
 
 
 def read_json(
@@ -134,29 +137,32 @@ class LeafGetter:
     should be an item or a list or dictionary composed of non-iterable items,
     nested dictionaries or nested lists.
 
-    A functional approach was considered instead of this class. However, I was
-    unable to come up with a way to store all of the leaves without "cheating"
-    and keeping "leaf" state.
+    Kept for backwards compatibility. Use `get_leaves` instead.
     """
 
     def __init__(self):
         self.leaves = []
 
     def get(self, item):
-        if isinstance(item, dict):
-            for _, v in item.items():
-                self.get(v)
-        elif isinstance(item, list):
-            for li in item:
-                self.get(li)
-        else:
-            self.leaves.append(item)
+        self.leaves += get_leaves(item)
 
 
 def get_leaves(item):
-    gl = LeafGetter()
-    gl.get(item)
-    return gl.leaves
+    """
+    Return all non-dict or non-list items of a given object in depth-first
+    order.
+    """
+    leaves = []
+    stack = [item]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(reversed(item.values()))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+        else:
+            leaves.append(item)
+    return leaves
 
 
 def ravel(nlabel_list):
@@ -166,8 +172,7 @@ def ravel(nlabel_list):
     raveled = []
     for maybe_list in nlabel_list:
         if isinstance(maybe_list, list):
-            for item in maybe_list:
-                raveled.append(item)
+            raveled.extend(maybe_list)
         else:
             raveled.append(maybe_list)
     return raveled
@@ -181,17 +186,15 @@ def consistent_labels(value_items: List[ValueObject]):
     """
     if not value_items:
         return set([])
-    used = set(k for k in value_items[0] if k not in ("value", "_auto"))
-    for vo in value_items:
-        if used != set(k for k in vo if k not in ("value", "_auto")):
-            return None
-    return used
+    not_labels = {"value", "_auto"}
+    used = value_items[0].keys() - not_labels
+    if all(vo.keys() - not_labels == used for vo in value_items):
+        return used
+    return None
 
 
 def ensure_value_object(vo) -> ValueObject:
-    if not isinstance(vo, list) or (
-        isinstance(vo, list) and not isinstance(vo[0], dict)
-    ):
+    if not isinstance(vo, list) or not isinstance(vo[0], dict):
         vo = [{"value": vo}]
     return vo
 